@@ -0,0 +1,352 @@
+import dataclasses
+import json
+import sys
+import typing
+import warnings
+from collections.abc import Collection, Mapping
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+try:
+	# orjson is an optional speed-up: `pip install printipy[orjson]`
+	import orjson
+
+	def dumps(data: Any) -> bytes:
+		# Like `json.dumps`, accept non-str keys in the free-form `Dict[str, Any]` fields
+		return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+	loads = orjson.loads
+except ImportError:
+
+	def dumps(data: Any) -> bytes:
+		return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+	loads = json.loads
+
+_SCALARS = (str, int, float, bool)
+
+# Key under which `config` stores its options in a field's metadata
+_METADATA_KEY = 'printipy'
+
+
+def _is_scalar(tp: Any) -> bool:
+	if tp in _SCALARS:
+		return True
+	if typing.get_origin(tp) is typing.Union:
+		return all(arg in _SCALARS or arg is type(None) for arg in typing.get_args(tp))
+	return False
+
+
+def config(
+	*,
+	encoder: Optional[Callable[[Any], Any]] = None,
+	decoder: Optional[Callable[[Any], Any]] = None,
+	exclude: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Dict[str, Any]]:
+	"""
+	Builds `dataclasses.field` metadata customising how a field is converted.
+
+	Args:
+	    encoder: Converts the field's value when building the dict sent to Printify
+	    decoder: Converts a value read from Printify before it is passed to the constructor
+	    exclude: Leaves the field out of `to_dict` when it returns True for the field's value
+	"""
+	options = {'encoder': encoder, 'decoder': decoder, 'exclude': exclude}
+	return {_METADATA_KEY: {k: v for k, v in options.items() if v is not None}}
+
+
+def encode(value: Any, encode_json: bool = False) -> Any:
+	"""Converts nested dataclasses and containers into plain dicts and lists."""
+	if dataclasses.is_dataclass(value) and not isinstance(value, type):
+		to_dict = getattr(value, 'to_dict', None)
+		if to_dict is not None:
+			return to_dict(encode_json=encode_json)
+		# Plain dataclasses, e.g. a caller's own inside a free-form `Dict[str, Any]` field
+		return {
+			f.name: encode(getattr(value, f.name), encode_json) for f in dataclasses.fields(value)
+		}
+	if isinstance(value, Mapping):
+		return {encode(k, encode_json): encode(v, encode_json) for k, v in value.items()}
+	if isinstance(value, Collection) and not isinstance(value, (str, bytes)):
+		return [encode(v, encode_json) for v in value]
+	return value
+
+
+def exclude_if_none(value: Any) -> bool:
+	return value is None
+
+
+def make_to_dict(cls: type) -> Callable[..., Dict[str, Any]]:
+	"""
+	Generates a `to_dict` for the dataclass `cls` that reads every field directly.
+
+	The generated function is straight-line code: a dict literal whose keys are interned string
+	constants, followed by one `if` per field carrying `exclude` metadata. No per-call reflection over
+	`dataclasses.fields` or the field metadata is needed. Scalar fields are copied as-is, fields with an
+	`encoder` in their `config` metadata go through that encoder, and everything else through
+	`encode`. Fields excluded with `exclude_if_none` are checked inline with `is not None`.
+	"""
+	hints = typing.get_type_hints(cls)
+	namespace: Dict[str, Any] = {'_encode': encode, '_cls': cls, '_for_subclass': _for_subclass}
+	entries = []
+	for f in dataclasses.fields(cls):
+		name = sys.intern(f.name)
+		overrides = f.metadata.get(_METADATA_KEY, {})
+		encoder = overrides.get('encoder')
+		exclude = overrides.get('exclude')
+		if encoder is not None:
+			namespace[f'_encoder_{name}'] = encoder
+			value = f'_encoder_{name}(self.{name})'
+		elif _is_scalar(hints[name]):
+			value = f'self.{name}'
+		else:
+			value = f'_encode(self.{name}, encode_json)'
+
+		if exclude is None:
+			condition = None
+		elif exclude is exclude_if_none:
+			condition = f'self.{name} is not None'
+		else:
+			namespace[f'_exclude_{name}'] = exclude
+			condition = f'not _exclude_{name}(self.{name})'
+		entries.append((name, value, condition))
+
+	# Fields ahead of the first conditional one go straight into the dict literal
+	literal = []
+	while entries and entries[0][2] is None:
+		name, value, _ = entries.pop(0)
+		literal.append(f'{name!r}: {value}')
+	body = [
+		# A subclass may add fields, so it gets a codec generated for itself
+		'if type(self) is not _cls:',
+		"\treturn _for_subclass(type(self), 'to_dict')(self, encode_json)",
+		f'result = {{{", ".join(literal)}}}',
+	]
+	for name, value, condition in entries:
+		assignment = f'result[{name!r}] = {value}'
+		body.append(assignment if condition is None else f'if {condition}:\n\t\t{assignment}')
+	body.append('return result')
+
+	source = 'def to_dict(self, encode_json=False):\n' + ''.join(f'\t{line}\n' for line in body)
+	exec(compile(source, f'<{cls.__name__}.to_dict>', 'exec'), namespace)
+	to_dict = namespace['to_dict']
+	to_dict.__qualname__ = f'{cls.__qualname__}.to_dict'
+	return to_dict
+
+
+def _coerce(tp: type) -> Callable[[Any], Any]:
+	def coerce(value):
+		return value if isinstance(value, tp) else tp(value)
+
+	return coerce
+
+
+def _decode_union(options: tuple) -> Callable[[Any], Any]:
+	# A member is only tried when every one of its required keys is present, so telling apart e.g. the
+	# shipping estimate line item shapes needs no exceptions
+	candidates = [
+		(option, {f.name for f in dataclasses.fields(option) if _is_required(f)})
+		for option in options
+		if dataclasses.is_dataclass(option)
+	]
+	# Required keys that only one member has pick that member with a single lookup
+	discriminators = {}
+	for clazz, required in candidates:
+		others = set().union(*(keys for option, keys in candidates if option is not clazz))
+		for key in sorted(required - others):
+			discriminators.setdefault(key, (clazz, required))
+
+	def decode(value):
+		if not isinstance(value, dict) or dict in options:
+			return value
+		for key, (clazz, required) in discriminators.items():
+			if key in value and required.issubset(value.keys()):
+				try:
+					return clazz.from_dict(value)
+				except (KeyError, ValueError, AttributeError):
+					break
+		for clazz, required in candidates:
+			if not required.issubset(value.keys()):
+				continue
+			try:
+				return clazz.from_dict(value)
+			except (KeyError, ValueError, AttributeError):
+				continue
+		warnings.warn(f'Failed to decode {value} Union dataclasses.')
+		return value
+
+	return decode
+
+
+def _decoder(tp: Any) -> Optional[Callable[[Any], Any]]:
+	"""Builds a function decoding a non-None value of type `tp`, or None if it is kept as-is."""
+	if tp in _SCALARS:
+		return _coerce(tp)
+	if dataclasses.is_dataclass(tp):
+		return lambda value: tp.from_dict(value)
+
+	origin, args = typing.get_origin(tp), typing.get_args(tp)
+	if origin is list:
+		item = _decoder(args[0]) if args else None
+		if item is None:
+			return list
+		return lambda value: [item(x) for x in value]
+	if origin is dict:
+		key = _decoder(args[0]) if args else None
+		item = _decoder(args[1]) if args else None
+		key = key or (lambda k: k)
+		item = item or (lambda v: v)
+		return lambda value: {key(k): item(v) for k, v in value.items()}
+	if origin is typing.Union:
+		options = tuple(arg for arg in args if arg is not type(None))
+		if len(options) == 1:
+			inner = _decoder(options[0])
+			if inner is None:
+				return None
+			return lambda value: None if value is None else inner(value)
+		return _decode_union(options)
+	return None
+
+
+def _is_required(f: dataclasses.Field) -> bool:
+	return f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+
+
+def make_from_dict(cls: type) -> classmethod:
+	"""
+	Generates a `from_dict` classmethod for the dataclass `cls`.
+
+	The generated function reads each field from the input dict once, decodes it with code specialised
+	for the field's type and calls the dataclass `__init__` with positional arguments. Missing fields
+	with defaults fall back to them, extra keys are ignored, and a `decoder` in a field's `config`
+	metadata is applied. With `infer_missing=True`, missing fields without a default become None.
+	"""
+	hints = typing.get_type_hints(cls)
+	required = {f.name: None for f in dataclasses.fields(cls) if _is_required(f)}
+	namespace: Dict[str, Any] = {
+		'_required_as_none': required,
+		'_cls': cls,
+		'_for_subclass': _for_subclass,
+	}
+	body = [
+		# A subclass may add fields, so it gets a codec generated for itself
+		'if cls is not _cls:',
+		"\treturn _for_subclass(cls, 'from_dict')(kvs, infer_missing=infer_missing)",
+		'if type(kvs) is not dict:',
+		'\tif isinstance(kvs, cls):',
+		'\t\treturn kvs',
+		'\tkvs = dict(kvs)',
+		'if infer_missing:',
+		'\tkvs = {**_required_as_none, **kvs}',
+	]
+	arguments = []
+	for index, f in enumerate(dataclasses.fields(cls)):
+		if not f.init:
+			raise TypeError(
+				f'{cls.__name__}.{f.name}: fields excluded from __init__ are not supported'
+			)
+		local, name, tp = f'v{index}', f.name, hints[f.name]
+		arguments.append(local)
+
+		if _is_required(f):
+			body.append(f'{local} = kvs[{name!r}]')
+		elif f.default is not dataclasses.MISSING:
+			namespace[f'_default_{name}'] = f.default
+			body.append(f'{local} = kvs.get({name!r}, _default_{name})')
+		else:
+			namespace[f'_factory_{name}'] = f.default_factory
+			body.append(f'{local} = kvs[{name!r}] if {name!r} in kvs else _factory_{name}()')
+
+		decoder = f.metadata.get(_METADATA_KEY, {}).get('decoder')
+		if decoder is not None:
+			namespace[f'_type_{name}'] = tp
+			namespace[f'_decoder_{name}'] = decoder
+			body.append(f'if {local} is not None and type({local}) is not _type_{name}:')
+			body.append(f'\t{local} = _decoder_{name}({local})')
+			continue
+
+		if typing.get_origin(tp) is typing.Union and type(None) in typing.get_args(tp):
+			options = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+			if len(options) == 1:
+				tp = options[0]
+		item = typing.get_args(tp)[0] if typing.get_origin(tp) is list else None
+		if tp in _SCALARS:
+			body.append(f'if {local} is not None and not isinstance({local}, {tp.__name__}):')
+			body.append(f'\t{local} = {tp.__name__}({local})')
+		elif dataclasses.is_dataclass(tp):
+			namespace[f'_type_{name}'] = tp
+			body.append(f'if {local} is not None:')
+			body.append(f'\t{local} = _type_{name}.from_dict({local}, infer_missing=infer_missing)')
+		elif dataclasses.is_dataclass(item):
+			namespace[f'_type_{name}'] = item
+			body.append(f'if {local} is not None:')
+			body.append(f'\t{local} = _type_{name}.from_list({local}, infer_missing=infer_missing)')
+		else:
+			decode = _decoder(tp)
+			if decode is not None:
+				namespace[f'_decode_{name}'] = decode
+				body.append(f'if {local} is not None:')
+				body.append(f'\t{local} = _decode_{name}({local})')
+	body.append(f'return cls({", ".join(arguments)})')
+
+	source = 'def from_dict(cls, kvs, *, infer_missing=False):\n' + ''.join(
+		f'\t{line}\n' for line in body
+	)
+	exec(compile(source, f'<{cls.__name__}.from_dict>', 'exec'), namespace)
+	from_dict = namespace['from_dict']
+	from_dict.__qualname__ = f'{cls.__qualname__}.from_dict'
+	return classmethod(from_dict)
+
+
+def _to_json(self, **kwargs) -> str:
+	return json.dumps(self.to_dict(), **kwargs)
+
+
+def _from_list(cls, rows: Iterable[Any], *, infer_missing: bool = False) -> list:
+	from_dict = cls.from_dict
+	if infer_missing:
+		return [from_dict(row, infer_missing=True) for row in rows]
+	return [from_dict(row) for row in rows]
+
+
+def _from_json(cls, s: Union[str, bytes], *, infer_missing: bool = False, **kwargs):
+	kvs = json.loads(s, **kwargs) if kwargs else loads(s)
+	return cls.from_dict(kvs, infer_missing=infer_missing)
+
+
+def _for_subclass(cls: type, name: str) -> Callable[..., Any]:
+	"""Generates the codec method `name` for a subclass of a data object and installs it there."""
+	setattr(cls, name, _MAKERS[name](cls))
+	return getattr(cls, name)
+
+
+class _Generated:
+	"""Class attribute that generates its codec method the first time it is looked up."""
+
+	def __init__(self, name: str):
+		self.name = name
+
+	def __get__(self, instance, owner=None):
+		if owner is None:
+			owner = type(instance)
+		# Generated for the class it is looked up on, so subclasses decode and encode their own fields
+		method = _MAKERS[self.name](owner)
+		setattr(owner, self.name, method)
+		return method.__get__(instance, owner)
+
+
+_MAKERS: Dict[str, Callable[[type], Any]] = {'to_dict': make_to_dict, 'from_dict': make_from_dict}
+
+
+def add_codec(cls: type) -> type:
+	"""
+	Attaches `to_dict`, `from_dict`, `from_list`, `to_json` and `from_json` to the dataclass `cls`.
+
+	`to_dict` and `from_dict` are generated on first use, so classes a program never converts cost
+	nothing at import time.
+	"""
+	cls.to_dict = _Generated('to_dict')
+	cls.from_dict = _Generated('from_dict')
+	cls.from_list = classmethod(_from_list)
+	cls.to_json = _to_json
+	cls.from_json = classmethod(_from_json)
+	return cls
@@ -1,5 +1,4 @@
 import base64
-import json
 import os
 from copy import deepcopy
 from json import JSONDecodeError
@@ -8,6 +7,7 @@ from typing import List, Optional, Dict, Union, Any
 import requests
 from requests import Response
 
+from printipy._codec import dumps as _dumps, loads as _loads
 from printipy.data_objects import (
 	Shop,
 	Blueprint,
@@ -43,14 +43,37 @@ from printipy.exceptions import (
 class _ApiHandlingMixin:
 	api_url = 'https://api.printify.com'
 
-	def __init__(self, api_token: str):
+	def __init__(self, api_token: str, session: Optional[requests.Session] = None):
+		"""
+		Args:
+		    api_token (str): API Token used to authenticate every request to Printify
+		    session (Optional[requests.Session]): Session used to send requests. A new one is created if none
+		    is given, and is closed by `close()`. Reusing one session keeps connections to the API alive
+		    between calls
+		"""
 		self.api_token = api_token
+		self._owns_session = session is None
+		self._session = session or requests.Session()
+
+	def close(self):
+		"""
+		Closes the session this API created. A session passed in by the caller is left open for the caller
+		to close.
+		"""
+		if self._owns_session:
+			self._session.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
 
 	@staticmethod
 	def __check_status(resp: Response, url: str):
 		if resp.status_code == 400:
 			try:
-				info = json.loads(resp.text)
+				info = _loads(resp.content)
 				message = f'{info["message"]} {info["errors"]["reason"]}'
 			except JSONDecodeError:
 				message = f'Bad Request: {url}'
@@ -59,14 +82,14 @@ class _ApiHandlingMixin:
 			raise InvalidScopeException('This API key is not permitted to access this information.')
 		elif resp.status_code == 500:
 			raise InvalidRequestException(f'Bad request to {url}')
-		data = resp.json()
+		data = _loads(resp.content)
 		if 'error' in data:
 			raise PrintifyException(data['error'])
 		return data
 
 	def _get(self, url):
 		headers = {'Authorization': f'Bearer {self.api_token}'}
-		resp = requests.get(url, headers=headers)
+		resp = self._session.get(url, headers=headers)
 		data = self.__check_status(resp, url)
 		return data
 
@@ -75,7 +98,8 @@ class _ApiHandlingMixin:
 			'Authorization': f'Bearer {self.api_token}',
 			'content-type': 'application/json',
 		}
-		resp = requests.post(url, headers=headers, json=data)
+		body = None if data is None else _dumps(data)
+		resp = self._session.post(url, headers=headers, data=body)
 		data = self.__check_status(resp, url)
 		return data
 
@@ -84,23 +108,21 @@ class _ApiHandlingMixin:
 			'Authorization': f'Bearer {self.api_token}',
 			'content-type': 'application/json',
 		}
-		resp = requests.put(url, headers=headers, json=data)
+		body = None if data is None else _dumps(data)
+		resp = self._session.put(url, headers=headers, data=body)
 		data = self.__check_status(resp, url)
 		return data
 
 	def _delete(self, url):
 		headers = {'Authorization': f'Bearer {self.api_token}'}
-		resp = requests.delete(url, headers=headers)
+		resp = self._session.delete(url, headers=headers)
 		data = self.__check_status(resp, url)
 		return data
 
 	@staticmethod
 	def _parse(clazz, data: Union[List, Dict]):
 		if isinstance(data, list):
-			all_elements = []
-			for item in data:
-				all_elements.append(clazz.from_dict(item))
-			return all_elements
+			return clazz.from_list(data)
 		elif isinstance(data, dict):
 			return clazz.from_dict(data)
 		else:
@@ -390,8 +412,20 @@ class PrintiPyProducts(_ApiHandlingMixin, _ShopIdMixin):
 	    >>> shop_products = api.products.get_products()
 	"""
 
-	def __init__(self, api_token: str, shop_id: Optional[Union[str, int]]):
-		_ApiHandlingMixin.__init__(self, api_token=api_token)
+	def __init__(
+		self,
+		api_token: str,
+		shop_id: Optional[Union[str, int]],
+		session: Optional[requests.Session] = None,
+	):
+		"""
+		Args:
+		    api_token (str): API Token used to authenticate every request to Printify
+		    shop_id (Optional[str]): The ID of a specific Printify shop, used when a call does not give one
+		    session (Optional[requests.Session]): Session used to send requests. A new one is created if none
+		    is given, and is closed by `close()`
+		"""
+		_ApiHandlingMixin.__init__(self, api_token=api_token, session=session)
 		_ShopIdMixin.__init__(self, shop_id=shop_id)
 
 	@_ShopIdMixin._require_shop_id
@@ -759,8 +793,20 @@ class PrintiPyOrders(_ApiHandlingMixin, _ShopIdMixin):
 	    >>> shop_orders = api.orders.get_orders()
 	"""
 
-	def __init__(self, api_token: str, shop_id: Optional[Union[str, int]]):
-		_ApiHandlingMixin.__init__(self, api_token=api_token)
+	def __init__(
+		self,
+		api_token: str,
+		shop_id: Optional[Union[str, int]],
+		session: Optional[requests.Session] = None,
+	):
+		"""
+		Args:
+		    api_token (str): API Token used to authenticate every request to Printify
+		    shop_id (Optional[str]): The ID of a specific Printify shop, used when a call does not give one
+		    session (Optional[requests.Session]): Session used to send requests. A new one is created if none
+		    is given, and is closed by `close()`
+		"""
+		_ApiHandlingMixin.__init__(self, api_token=api_token, session=session)
 		_ShopIdMixin.__init__(self, shop_id=shop_id)
 
 	@_ShopIdMixin._require_shop_id
@@ -1375,11 +1421,12 @@ class PrintiPyArtwork(_ApiHandlingMixin):
 				'url': url,
 			}
 		elif filename:
+			# Printify takes base64 inside the JSON body, so only the str is kept for the upload
 			with open(filename, 'rb') as f:
-				b64data = base64.b64encode(f.read())
+				contents = base64.b64encode(f.read()).decode('ascii')
 			artwork_data = {
 				'file_name': os.path.basename(filename),
-				'contents': b64data.decode('utf-8'),
+				'contents': contents,
 			}
 		else:
 			raise PrintiPyException('Must provide at least a local filename or url for upload.')
@@ -1419,8 +1466,20 @@ class PrintiPyWebhooks(_ApiHandlingMixin, _ShopIdMixin):
 	    >>> webhooks = api.webhooks.get_webhooks()
 	"""
 
-	def __init__(self, api_token: str, shop_id: Optional[Union[str, int]]):
-		_ApiHandlingMixin.__init__(self, api_token=api_token)
+	def __init__(
+		self,
+		api_token: str,
+		shop_id: Optional[Union[str, int]],
+		session: Optional[requests.Session] = None,
+	):
+		"""
+		Args:
+		    api_token (str): API Token used to authenticate every request to Printify
+		    shop_id (Optional[str]): The ID of a specific Printify shop, used when a call does not give one
+		    session (Optional[requests.Session]): Session used to send requests. A new one is created if none
+		    is given, and is closed by `close()`
+		"""
+		_ApiHandlingMixin.__init__(self, api_token=api_token, session=session)
 		_ShopIdMixin.__init__(self, shop_id=shop_id)
 
 	@_ShopIdMixin._require_shop_id
@@ -1597,7 +1656,12 @@ class PrintiPy:
 	    >>> shop456_products = api.products.get_products(shop_id='shop456')
 	"""
 
-	def __init__(self, api_token: str, shop_id: Optional[Union[str, int]] = None):
+	def __init__(
+		self,
+		api_token: str,
+		shop_id: Optional[Union[str, int]] = None,
+		session: Optional[requests.Session] = None,
+	):
 		"""
 		Entrypoint needed to access all [Printify APIs](https://developers.printify.com/)
 
@@ -1607,10 +1671,40 @@ class PrintiPy:
 		    to generate a token
 		    shop_id (Optional[str]): The ID of a specific Printify shop. If none is given, some APIs will still
 		    work (as they do not require a Shop) while others will require a Shop ID to be passed upon a function call
+		    session (Optional[requests.Session]): A configured session (proxies, retries, adapters) to send every
+		    request through. If none is given, PrintiPy creates one and shares it between all APIs
+		"""
+		self._owns_session = session is None
+		self._session = session = session or requests.Session()
+		self.shops = PrintiPyShop(api_token=api_token, session=session)
+		self.catalog = PrintiPyCatalog(api_token=api_token, session=session)
+		self.products = PrintiPyProducts(api_token=api_token, shop_id=shop_id, session=session)
+		self.orders = PrintiPyOrders(api_token=api_token, shop_id=shop_id, session=session)
+		self.artwork = PrintiPyArtwork(api_token=api_token, session=session)
+		self.webhooks = PrintiPyWebhooks(api_token=api_token, shop_id=shop_id, session=session)
+
+	def close(self):
+		"""
+		Closes the connections PrintiPy opened to Printify. A session passed in by the caller is left open
+		for the caller to close.
+
+		Examples:
+		    To close it explicitly
+		    >>> from printipy.api import PrintiPy
+		    >>> api = PrintiPy(api_token='...')
+		    >>> shops = api.shops.get_shops()
+		    >>> api.close()
+
+		    To close it on leaving a `with` block
+		    >>> from printipy.api import PrintiPy
+		    >>> with PrintiPy(api_token='...') as api:
+		    ...     shops = api.shops.get_shops()
 		"""
-		self.shops = PrintiPyShop(api_token=api_token)
-		self.catalog = PrintiPyCatalog(api_token=api_token)
-		self.products = PrintiPyProducts(api_token=api_token, shop_id=shop_id)
-		self.orders = PrintiPyOrders(api_token=api_token, shop_id=shop_id)
-		self.artwork = PrintiPyArtwork(api_token=api_token)
-		self.webhooks = PrintiPyWebhooks(api_token=api_token, shop_id=shop_id)
+		if self._owns_session:
+			self._session.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
@@ -1,15 +1,55 @@
+import operator
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Union, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Union, Dict, Any, Iterable
 
-from dataclasses_json import dataclass_json, config
+from printipy._codec import add_codec, config, exclude_if_none as _exclude_if_none
 
 
-def _exclude_if_none(value):
-	return value is None
+_get_id = operator.attrgetter('id')
 
+# `slots=True` is only understood by `dataclasses.dataclass` on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass_json
-@dataclass
+
+def _intern(value: Optional[str]) -> Optional[str]:
+	# Shares one string object between the many records carrying the same small set of values.
+	# Exact type on purpose: `sys.intern` raises TypeError on str subclasses
+	return sys.intern(value) if type(value) is str else value  # noqa: E721
+
+
+def _intern_all(values: Optional[List[str]]) -> None:
+	# In place, so the caller's list is neither copied nor detached from the object
+	if isinstance(values, list):
+		for index, value in enumerate(values):
+			values[index] = _intern(value)
+
+
+# Shared by every optional field that is left out of `to_dict` while unset
+_EXCLUDE_IF_NONE = config(exclude=_exclude_if_none)
+
+
+def _optional_field():
+	return field(default=None, metadata=_EXCLUDE_IF_NONE)
+
+
+def _parse_datetime(value: Union[str, datetime]) -> datetime:
+	if not isinstance(value, str):
+		return value
+	# `datetime.fromisoformat` only accepts a `Z` suffix from Python 3.11 onwards
+	if value.endswith('Z'):
+		value = f'{value[:-1]}+00:00'
+	return datetime.fromisoformat(value)
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+	# Anything else, e.g. the None left by `from_dict(..., infer_missing=True)`, is passed through
+	return value.isoformat(sep=' ') if isinstance(value, datetime) else value
+
+
+@add_codec
+@dataclass(**_SLOTS)
 class Shop:
 	"""
 	Shop object to store and validate shop data between Python and Printify
@@ -24,9 +64,12 @@ class Shop:
 	title: str
 	sales_channel: str
 
+	def __post_init__(self):
+		self.sales_channel = _intern(self.sales_channel)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class Blueprint:
 	"""
 	Blueprint object to store and validate shop data between Python and Printify
@@ -48,8 +91,8 @@ class Blueprint:
 	images: List[str]
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class Location:
 	"""
 	Location object to store and validate shop data between Python and Printify
@@ -71,8 +114,8 @@ class Location:
 	address2: Optional[str] = field(default=None)
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class Address:
 	"""
 	Address object to store and validate shop data between Python and Printify.
@@ -102,11 +145,11 @@ class Address:
 	address2: Optional[str] = field(default=None)
 	email: Optional[str] = field(default=None)
 	phone: Optional[str] = field(default=None)
-	company: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
+	company: Optional[str] = _optional_field()
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class PrintProvider:
 	"""
 	Print Provider object to store and validate shop data between Python and Printify.
@@ -119,11 +162,11 @@ class PrintProvider:
 
 	id: int
 	title: str
-	location: Optional[Location] = field(default=None, metadata=config(exclude=_exclude_if_none))
+	location: Optional[Location] = _optional_field()
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class VariantOption:
 	"""
 	Object representing various options for Variants. Stores and validate data between Python and Printify.
@@ -136,14 +179,14 @@ class VariantOption:
 	    quantity: Quantity of item. Defaults to None.
 	"""
 
-	color: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	size: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	paper: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	quantity: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
+	color: Optional[str] = _optional_field()
+	size: Optional[str] = _optional_field()
+	paper: Optional[str] = _optional_field()
+	quantity: Optional[str] = _optional_field()
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class VariantPlaceholder:
 	"""
 	Object representing the Placeholder for a product variant. Stores and validate data between Python and Printify.
@@ -158,9 +201,12 @@ class VariantPlaceholder:
 	height: int
 	width: int
 
+	def __post_init__(self):
+		object.__setattr__(self, 'position', _intern(self.position))
 
-@dataclass_json
-@dataclass
+
+@add_codec
+@dataclass(**_SLOTS)
 class Variant:
 	"""
 	Object representing a Variant for a product. Stores and validate data between Python and Printify.
@@ -178,8 +224,8 @@ class Variant:
 	placeholders: List[VariantPlaceholder]
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class PrintProviderVariants:
 	"""
 	Object representing a Variant from a print provider. Stores and validate data between Python and Printify.
@@ -198,11 +244,11 @@ class PrintProviderVariants:
 		"""
 		Returns a list of all IDs from the associated variants
 		"""
-		return [x.id for x in self.variants]
+		return list(map(_get_id, self.variants))
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class ShippingInfoHandlingTime:
 	"""
 	Object representing the handling time for a given shipping option from a print provider.
@@ -216,9 +262,12 @@ class ShippingInfoHandlingTime:
 	value: int
 	unit: str
 
+	def __post_init__(self):
+		object.__setattr__(self, 'unit', _intern(self.unit))
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class ShippingInfoProfileCost:
 	"""
 	Object representing the shipping cost for an item from a print provider.
@@ -232,9 +281,12 @@ class ShippingInfoProfileCost:
 	cost: int
 	currency: str
 
+	def __post_init__(self):
+		object.__setattr__(self, 'currency', _intern(self.currency))
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ShippingInfoProfile:
 	"""
 	Object representing the shipping profile a group of items to a given set of countries from a print provider.
@@ -252,9 +304,12 @@ class ShippingInfoProfile:
 	additional_items: ShippingInfoProfileCost
 	countries: List[str]
 
+	def __post_init__(self):
+		_intern_all(self.countries)
 
-@dataclass_json
-@dataclass
+
+@add_codec
+@dataclass(**_SLOTS)
 class ShippingInfo:
 	"""
 	Object representing all shipping information for a group of items from a print provider.
@@ -269,8 +324,8 @@ class ShippingInfo:
 	profiles: List[ShippingInfoProfile]
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class ShippingCost:
 	"""
 	Object representing all shipping costs from a print provider.
@@ -285,8 +340,8 @@ class ShippingCost:
 	express: Optional[int] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ShippingEstimateLineItemByProduct:
 	"""
 	Object representing a shipping estimate for an item based on its product and variant information.
@@ -305,8 +360,8 @@ class ShippingEstimateLineItemByProduct:
 	quantity: int
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ShippingEstimateLineItemByVariant:
 	"""
 	Object representing a shipping estimate for a new item based on its variant information.
@@ -327,8 +382,8 @@ class ShippingEstimateLineItemByVariant:
 	quantity: int
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ShippingEstimateLineItemBySku:
 	"""
 	Object representing a shipping estimate for an item based on SKU number and quantity.
@@ -345,8 +400,8 @@ class ShippingEstimateLineItemBySku:
 	quantity: int
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateShippingEstimate:
 	"""
 	Object representing a shipping estimate for a list of items to a given address from a print provider.
@@ -368,8 +423,8 @@ class CreateShippingEstimate:
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class ProductOptionValue:
 	"""
 	Object representing product option information for a published product.
@@ -384,8 +439,8 @@ class ProductOptionValue:
 	title: str
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductOption:
 	"""
 	Object representing product option information for a published product.
@@ -402,8 +457,8 @@ class ProductOption:
 	values: List[ProductOptionValue]
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductVariant:
 	"""
 	Object representing variant information for a published product.
@@ -436,8 +491,8 @@ class ProductVariant:
 	quantity: Optional[int] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductImage:
 	"""
 	Object representing image information for a published product.
@@ -457,9 +512,12 @@ class ProductImage:
 	is_default: bool
 	is_selected_for_publishing: Optional[bool] = None
 
+	def __post_init__(self):
+		self.position = _intern(self.position)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class PrintAreaInfo:
 	"""
 	Options to create or update a print area for an image. Stores and validate data between Python and Printify.
@@ -477,8 +535,8 @@ class PrintAreaInfo:
 	angle: int
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class PlaceholderImage(PrintAreaInfo):
 	"""
 	Object representing placeholder information for a published product.
@@ -503,8 +561,8 @@ class PlaceholderImage(PrintAreaInfo):
 	width: Optional[int] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductPlaceholder:
 	"""
 	Object representing placeholder information for a published product.
@@ -518,9 +576,12 @@ class ProductPlaceholder:
 	position: str
 	images: List[PlaceholderImage]
 
+	def __post_init__(self):
+		self.position = _intern(self.position)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductPrintArea:
 	"""
 	Object representing a print area for a published product.
@@ -537,8 +598,8 @@ class ProductPrintArea:
 	background: Optional[str] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class ProductExternal:
 	"""
 	Object representing storefront information for a published product.
@@ -557,8 +618,8 @@ class ProductExternal:
 	channel: Optional[str] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class Product:
 	"""
 	Object representing a product in Printify.
@@ -607,8 +668,8 @@ class Product:
 	external: Optional[ProductExternal] = None
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class Publish:
 	"""
 	Object that tells Printify what to publish to a shop for a given product.
@@ -632,9 +693,19 @@ class Publish:
 	keyFeatures: bool = True
 	shipping_template: bool = True
 
+	@classmethod
+	def default(cls) -> 'Publish':
+		"""
+		Returns a shared instance with every flag set, i.e. publish everything.
+		"""
+		return _DEFAULT_PUBLISH
 
-@dataclass_json
-@dataclass
+
+_DEFAULT_PUBLISH = Publish()
+
+
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class PublishingSucceededExternal:
 	"""
 	Options to set storefront information for a product that has been successfully published.
@@ -649,8 +720,8 @@ class PublishingSucceededExternal:
 	handle: str
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class PublishingSucceeded:
 	"""
 	Options to set a product publishing to a storefront as succeeded.
@@ -663,8 +734,8 @@ class PublishingSucceeded:
 	external: PublishingSucceededExternal
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class LineItem:
 	"""
 	Information for an order containing specific product, the variant used, and the quantity ordered.
@@ -694,9 +765,12 @@ class LineItem:
 	sent_to_production_at: Optional[str] = None
 	fulfilled_at: Optional[str] = None
 
+	def __post_init__(self):
+		self.status = _intern(self.status)
 
-@dataclass_json
-@dataclass
+
+@add_codec
+@dataclass(**_SLOTS)
 class Shipment:
 	"""
 	Object representing a shipment for an order
@@ -714,9 +788,12 @@ class Shipment:
 	url: str
 	delivered_at: str
 
+	def __post_init__(self):
+		self.carrier = _intern(self.carrier)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class Order:
 	"""
 	Object representing a previously created order.
@@ -754,17 +831,20 @@ class Order:
 	fulfilled_at: Optional[str] = None
 	fulfilment_type: Optional[str] = None
 
+	def __post_init__(self):
+		self.status = _intern(self.status)
+
 
-@dataclass_json
-@dataclass
-class __CreateOrderLineItemBase:
+@add_codec
+@dataclass(**_SLOTS)
+class _CreateOrderLineItemBase:
 	variant_id: int
 	quantity: int
 
 
-@dataclass_json
-@dataclass
-class CreateOrderLineItem(__CreateOrderLineItemBase):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderLineItem(_CreateOrderLineItemBase):
 	"""
 	Options to create an line item for an order order by using product information.
 	Stores and validate data between Python and Printify.
@@ -778,15 +858,15 @@ class CreateOrderLineItem(__CreateOrderLineItemBase):
 	product_id: str
 
 
-@dataclass_json
-@dataclass
-class __CreateOrder:
+@add_codec
+@dataclass(**_SLOTS)
+class _CreateOrder:
 	pass
 
 
-@dataclass_json
-@dataclass
-class CreateOrderByExistingProduct(__CreateOrder):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderByExistingProduct(_CreateOrder):
 	"""
 	Options to create an order for existing products. Stores and validate data between Python and Printify.
 
@@ -807,9 +887,9 @@ class CreateOrderByExistingProduct(__CreateOrder):
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
-class CreateOrderLineItemSimpleProcessing(__CreateOrderLineItemBase):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderLineItemSimpleProcessing(_CreateOrderLineItemBase):
 	"""
 	Options to create an line item for an order by using product information and using simple print area information
 	and transformations. Stores and validate data between Python and Printify.
@@ -832,8 +912,8 @@ class CreateOrderLineItemSimpleProcessing(__CreateOrderLineItemBase):
 	print_areas: Dict[str, Any]
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateOrderBySimpleImageProcessing(CreateOrderByExistingProduct):
 	"""
 	Options to create an order for existing products with simple image manipulations against a blueprint, variant,
@@ -856,8 +936,8 @@ class CreateOrderBySimpleImageProcessing(CreateOrderByExistingProduct):
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateOrderLineItemAdvancedProcessingPrintAreaInfo(PrintAreaInfo):
 	"""
 	Options to create or update a print area for an image. Stores and validate data between Python and Printify.
@@ -873,9 +953,9 @@ class CreateOrderLineItemAdvancedProcessingPrintAreaInfo(PrintAreaInfo):
 	src: str
 
 
-@dataclass_json
-@dataclass
-class CreateOrderLineItemAdvancedProcessing(__CreateOrderLineItemBase):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderLineItemAdvancedProcessing(_CreateOrderLineItemBase):
 	"""
 	Options to create an line item for an order order by using advanced image processing.
 	Stores and validate data between Python and Printify.
@@ -893,12 +973,12 @@ class CreateOrderLineItemAdvancedProcessing(__CreateOrderLineItemBase):
 
 	blueprint_id: int
 	print_provider_id: int
-	print_areas: Dict[str, List[PrintAreaInfo]]
+	print_areas: Dict[str, List[CreateOrderLineItemAdvancedProcessingPrintAreaInfo]]
 
 
-@dataclass_json
-@dataclass
-class CreateOrderByAdvancedImageProcessing(__CreateOrder):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderByAdvancedImageProcessing(_CreateOrder):
 	"""
 	Options to create an order by advanced image processing. This method allows for setting a new blueprint,
 	print provider, and print areas for each line item.
@@ -925,8 +1005,8 @@ class CreateOrderByAdvancedImageProcessing(__CreateOrder):
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateOrderLineItemPrintDetails(CreateOrderLineItemSimpleProcessing):
 	"""
 	Options to create an line item for an order by using product information and using simple print area information
@@ -951,9 +1031,9 @@ class CreateOrderLineItemPrintDetails(CreateOrderLineItemSimpleProcessing):
 	print_details: Dict[str, Any]
 
 
-@dataclass_json
-@dataclass
-class CreateOrderByPrintDetails(__CreateOrder):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderByPrintDetails(_CreateOrder):
 	"""
 	Options to create an order by print details. Stores and validate data between Python and Printify.
 
@@ -976,8 +1056,8 @@ class CreateOrderByPrintDetails(__CreateOrder):
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateOrderLineItemSku:
 	"""
 	Options to create an line item for an order by using SKU. Stores and validate data between Python and Printify.
@@ -991,9 +1071,9 @@ class CreateOrderLineItemSku:
 	quantity: int
 
 
-@dataclass_json
-@dataclass
-class CreateOrderBySku(__CreateOrder):
+@add_codec
+@dataclass(**_SLOTS)
+class CreateOrderBySku(_CreateOrder):
 	"""
 	Options to create an order by an SKU number. Stores and validate data between Python and Printify.
 
@@ -1014,8 +1094,8 @@ class CreateOrderBySku(__CreateOrder):
 	address_to: Address
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class Artwork:
 	"""
 	Object representing an Image or Artwork. Stores and validate data between Python and Printify.
@@ -1028,7 +1108,7 @@ class Artwork:
 	    size: byte size of the image
 	    mime_type: media type of the image, e.g., `image/png`
 	    preview_url: URL to preview the image
-	    upload_time: ISO date format of the time the image was uploaded
+	    upload_time: time the image was uploaded, parsed from Printify's ISO date format
 	"""
 
 	id: str
@@ -1038,11 +1118,15 @@ class Artwork:
 	size: int
 	mime_type: str
 	preview_url: str
-	upload_time: str
+	upload_time: datetime = field(metadata=config(encoder=_format_datetime))
 
+	def __post_init__(self):
+		self.mime_type = _intern(self.mime_type)
+		self.upload_time = _parse_datetime(self.upload_time)
 
-@dataclass_json
-@dataclass
+
+@add_codec
+@dataclass(**_SLOTS)
 class Webhook:
 	"""
 	Object representing a Webhook. Stores and validate data between Python and Printify.
@@ -1059,9 +1143,12 @@ class Webhook:
 	url: str
 	topic: str
 
+	def __post_init__(self):
+		self.topic = _intern(self.topic)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class CreateWebhook:
 	"""
 	Options to create a webhook. Stores and validate data between Python and Printify.
@@ -1075,8 +1162,8 @@ class CreateWebhook:
 	topic: str
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class UpdateWebhook:
 	"""
 	Options to update a webhook. All fields are optional. Stores and validate data between Python and Printify.
@@ -1086,12 +1173,12 @@ class UpdateWebhook:
 	    topic: type of event to push data to
 	"""
 
-	url: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	topic: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
+	url: Optional[str] = _optional_field()
+	topic: Optional[str] = _optional_field()
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateProductPrintAreaPlaceholderImage(PrintAreaInfo):
 	"""
 	Options to create a new image in a place holder for a print area.
@@ -1108,8 +1195,8 @@ class CreateProductPrintAreaPlaceholderImage(PrintAreaInfo):
 	id: str
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateProductPrintAreaPlaceholder:
 	"""
 	Options to create a new print area for a product placeholder. Stores and validate data between Python and Printify.
@@ -1122,9 +1209,12 @@ class CreateProductPrintAreaPlaceholder:
 	position: str
 	images: List[CreateProductPrintAreaPlaceholderImage]
 
+	def __post_init__(self):
+		self.position = _intern(self.position)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class CreateProductPrintArea:
 	"""
 	Options to create a new product print area. Stores and validate data between Python and Printify.
@@ -1137,9 +1227,18 @@ class CreateProductPrintArea:
 	variant_ids: List[int]
 	placeholders: List[CreateProductPrintAreaPlaceholder]
 
+	def __post_init__(self):
+		# Checked only in development; `python -O` strips these asserts
+		if __debug__:
+			# None is what `from_dict(..., infer_missing=True)` fills in for missing fields.
+			# bool is an int subclass, so it is ruled out explicitly
+			assert self.variant_ids is None or all(
+				isinstance(v, int) and not isinstance(v, bool) for v in self.variant_ids
+			), 'variant_ids must all be int'
 
-@dataclass_json
-@dataclass
+
+@add_codec
+@dataclass(frozen=True, **_SLOTS)
 class CreateProductVariant:
 	"""
 	Options to create a new product variant. Stores and validate data between Python and Printify.
@@ -1154,9 +1253,21 @@ class CreateProductVariant:
 	price: int
 	is_enabled: bool
 
-
-@dataclass_json
-@dataclass
+	def __post_init__(self):
+		# Checked only in development; `python -O` strips these asserts
+		if __debug__:
+			# None is what `from_dict(..., infer_missing=True)` fills in for missing fields.
+			# bool is an int subclass, so it is ruled out explicitly
+			assert self.id is None or (
+				isinstance(self.id, int) and not isinstance(self.id, bool) and self.id > 0
+			), f'Invalid variant ID: {self.id!r}'
+			assert self.price is None or (
+				isinstance(self.price, int) and not isinstance(self.price, bool) and self.price >= 0
+			), f'Invalid price: {self.price!r}'
+
+
+@add_codec
+@dataclass(**_SLOTS)
 class CreateProduct:
 	"""
 	Options to create a new product. Stores and validate data between Python and Printify.
@@ -1195,9 +1306,29 @@ class CreateProduct:
 		"""
 		self.print_areas.append(print_area)
 
+	def add_variants(self, variants: Iterable[CreateProductVariant]):
+		"""
+		Appends several new variants to the product at once. Prefer this over repeated calls to `add_variant`
+		when attaching more than a handful of variants.
+
+		Args:
+		    variants: New variants to attach to the new product
+		"""
+		self.variants.extend(variants)
+
+	def add_print_areas(self, print_areas: Iterable[CreateProductPrintArea]):
+		"""
+		Appends several new print areas to the product at once. Prefer this over repeated calls to
+		`add_print_area` when attaching more than a handful of print areas.
+
+		Args:
+		    print_areas: New print areas to attach to the new product
+		"""
+		self.print_areas.extend(print_areas)
+
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class UpdateProductExternal:
 	"""
 	Options to update a product external information. Stores and validate data between Python and Printify.
@@ -1208,15 +1339,13 @@ class UpdateProductExternal:
 	    shipping_template_id: Shipping methods in the store the product will use
 	"""
 
-	id: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	handle: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	shipping_template_id: Optional[str] = field(
-		default=None, metadata=config(exclude=_exclude_if_none)
-	)
+	id: Optional[str] = _optional_field()
+	handle: Optional[str] = _optional_field()
+	shipping_template_id: Optional[str] = _optional_field()
 
 
-@dataclass_json
-@dataclass
+@add_codec
+@dataclass(**_SLOTS)
 class UpdateProduct:
 	"""
 	Options to update a product and its information. All fields are optional.
@@ -1232,18 +1361,10 @@ class UpdateProduct:
 	    external: New external information - storefront and shipping - for the product
 	"""
 
-	title: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	description: Optional[str] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	blueprint_id: Optional[int] = field(default=None, metadata=config(exclude=_exclude_if_none))
-	print_provider_id: Optional[int] = field(
-		default=None, metadata=config(exclude=_exclude_if_none)
-	)
-	variants: Optional[List[CreateProductVariant]] = field(
-		default=None, metadata=config(exclude=_exclude_if_none)
-	)
-	print_areas: Optional[List[CreateProductPrintArea]] = field(
-		default=None, metadata=config(exclude=_exclude_if_none)
-	)
-	external: Optional[UpdateProductExternal] = field(
-		default=None, metadata=config(exclude=_exclude_if_none)
-	)
+	title: Optional[str] = _optional_field()
+	description: Optional[str] = _optional_field()
+	blueprint_id: Optional[int] = _optional_field()
+	print_provider_id: Optional[int] = _optional_field()
+	variants: Optional[List[CreateProductVariant]] = _optional_field()
+	print_areas: Optional[List[CreateProductPrintArea]] = _optional_field()
+	external: Optional[UpdateProductExternal] = _optional_field()
@@ -1,11 +1,13 @@
+import json
 import os
 from typing import Union, Optional, Dict, List
-from unittest import TestCase
+from unittest import TestCase, mock
 
+import requests
 import responses
 from responses import matchers
 
-from printipy.api import PrintiPy
+from printipy.api import PrintiPy, PrintiPyShop
 from printipy.exceptions import PrintiPyException
 from printipy.data_objects import (
 	Shop,
@@ -38,6 +40,9 @@ class TestPrintiPyApiV1(TestCase):
 	shop_id = 'shop_123'
 	api = PrintiPy(api_token=test_api_token, shop_id=shop_id)
 	default_headers = {'Authorization': f'Bearer {test_api_token}'}
+	json_headers = {**default_headers, 'content-type': 'application/json'}
+	default_matchers = [matchers.header_matcher(default_headers)]
+	json_matchers = [matchers.header_matcher(json_headers)]
 
 	def prepare_response(
 		self,
@@ -47,17 +52,71 @@ class TestPrintiPyApiV1(TestCase):
 	):
 		if data is None:
 			data = {}
-		headers = self.default_headers
-		if http_type in {'post', 'put'}:
-			headers = headers.update({'content-type': 'application/json'})
+		match = self.default_matchers
+		if http_type in {responses.POST, responses.PUT}:
+			match = self.json_matchers
 		responses.add(
 			http_type,
-			match=[matchers.header_matcher(headers)],
+			match=match,
 			url=url,
 			json=data,
 		)
 
 
+class TestPrintiPyClientV1(TestPrintiPyApiV1):
+	def test_apis_share_one_session(self):
+		sessions = {
+			id(api._session)
+			for api in (
+				self.api.shops,
+				self.api.catalog,
+				self.api.products,
+				self.api.orders,
+				self.api.artwork,
+				self.api.webhooks,
+			)
+		}
+		self.assertEqual(len(sessions), 1)
+
+	@responses.activate
+	def test_requests_go_through_an_injected_session(self):
+		session = requests.Session()
+		api = PrintiPy(api_token=self.test_api_token, shop_id=self.shop_id, session=session)
+		self.prepare_response(responses.GET, url='https://api.printify.com/v1/shops.json', data=[])
+
+		with mock.patch.object(session, 'send', wraps=session.send) as send:
+			self.assertEqual(api.shops.get_shops(), [])
+		send.assert_called_once()
+		self.assertEqual(send.call_args[0][0].url, 'https://api.printify.com/v1/shops.json')
+
+	def test_close_leaves_an_injected_session_open(self):
+		session = mock.create_autospec(requests.Session, instance=True)
+		PrintiPy(api_token=self.test_api_token, session=session).close()
+		session.close.assert_not_called()
+
+	def test_close_closes_its_own_session(self):
+		api = PrintiPy(api_token=self.test_api_token)
+		with mock.patch.object(api._session, 'close') as close:
+			api.close()
+		close.assert_called_once()
+
+	def test_with_block_closes_its_own_session(self):
+		with mock.patch.object(requests.Session, 'close') as close:
+			with PrintiPy(api_token=self.test_api_token):
+				close.assert_not_called()
+		close.assert_called_once()
+
+	def test_standalone_apis_close_their_own_session(self):
+		with mock.patch.object(requests.Session, 'close') as close:
+			with PrintiPyShop(api_token=self.test_api_token):
+				close.assert_not_called()
+		close.assert_called_once()
+
+		session = mock.create_autospec(requests.Session, instance=True)
+		PrintiPyShop(api_token=self.test_api_token, session=session).close()
+		session.close.assert_not_called()
+
+
 class TestPrintiPyShopsApiV1(TestPrintiPyApiV1):
 	@responses.activate
 	def test_get_shops(self):
@@ -274,7 +333,8 @@ class TestPrintiPyCatalogApiV1(TestPrintiPyApiV1):
 			for key in ['id', 'title']:
 				self.assertIsNotNone(provider.__getattribute__(key), f'{key} should not be None')
 
-		self.assertIsNotNone(next(filter(lambda p: p.id == 24, providers)).location)
+		providers_by_id = {provider.id: provider for provider in providers}
+		self.assertIsNotNone(providers_by_id[24].location)
 
 	@responses.activate
 	def test_get_variants(self):
@@ -2195,6 +2255,11 @@ class TestPrintiPyOrdersApiV1(TestPrintiPyApiV1):
 			),
 			data_returned_from_url['id'],
 		)
+		sent_order = json.loads(responses.calls[0].request.body)
+		self.assertEqual(
+			[image['src'] for image in sent_order['line_items'][0]['print_areas']['front']],
+			[image['src'] for image in data_for_url['line_items'][0]['print_areas']['front']],
+		)
 
 	@responses.activate
 	def test_create_order_with_print_details(self):
@@ -2745,6 +2810,7 @@ class TestPrintiPyWebhooksApiV1(TestPrintiPyApiV1):
 			),
 			Webhook.from_dict(data_returned_from_url),
 		)
+		self.assertEqual(json.loads(responses.calls[0].request.body), data_for_url)
 
 	def test_create_webhook_raises_exception_without_shop_id(self):
 		data_for_url = {
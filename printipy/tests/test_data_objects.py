@@ -0,0 +1,432 @@
+import sys
+from dataclasses import FrozenInstanceError, dataclass
+from datetime import datetime
+from unittest import TestCase, skipIf
+
+from printipy._codec import dumps, loads
+from printipy.data_objects import (
+	Artwork,
+	CreateOrderByPrintDetails,
+	CreateOrderLineItemPrintDetails,
+	CreateOrderBySku,
+	CreateProduct,
+	CreateProductPrintArea,
+	CreateProductPrintAreaPlaceholder,
+	CreateProductPrintAreaPlaceholderImage,
+	CreateProductVariant,
+	CreateShippingEstimate,
+	CreateWebhook,
+	PlaceholderImage,
+	PrintProviderVariants,
+	ProductImage,
+	Publish,
+	ShippingEstimateLineItemByProduct,
+	ShippingEstimateLineItemBySku,
+	ShippingEstimateLineItemByVariant,
+	ShippingInfoProfile,
+	ShippingInfoProfileCost,
+	Shop,
+	UpdateProduct,
+	UpdateProductExternal,
+	VariantOption,
+)
+
+
+class TestDataObjects(TestCase):
+	artwork_data = {
+		'id': '5e16d66791287a0006e522b1',
+		'file_name': 'png-images-logo-1.jpg',
+		'height': 5979,
+		'width': 17045,
+		'size': 1138575,
+		'mime_type': 'image/png',
+		'preview_url': 'https://example.com/image-storage/uuid1',
+		'upload_time': '2020-01-09 07:29:43',
+	}
+
+	@skipIf(sys.version_info < (3, 10), 'dataclass slots require Python 3.10+')
+	def test_data_objects_use_slots(self):
+		artwork = Artwork.from_dict(self.artwork_data)
+		self.assertFalse(hasattr(artwork, '__dict__'))
+		with self.assertRaises(AttributeError):
+			artwork.not_a_field = 'value'
+
+		placeholder_image = PlaceholderImage(x=0.5, y=0.5, scale=1, angle=0, id='image_id')
+		self.assertFalse(hasattr(placeholder_image, '__dict__'))
+		self.assertEqual(
+			placeholder_image.to_dict(),
+			{
+				'x': 0.5,
+				'y': 0.5,
+				'scale': 1,
+				'angle': 0,
+				'id': 'image_id',
+				'name': None,
+				'type': None,
+				'height': None,
+				'width': None,
+			},
+		)
+
+	def test_data_objects_round_trip(self):
+		artwork = Artwork.from_dict(self.artwork_data)
+		self.assertEqual(artwork.upload_time, datetime(2020, 1, 9, 7, 29, 43))
+		self.assertEqual(artwork.to_dict(), self.artwork_data)
+		self.assertEqual(Artwork.from_json(artwork.to_json()), artwork)
+		self.assertEqual(Artwork.from_json(artwork.to_json().encode('utf-8')), artwork)
+
+		partial = Artwork.from_dict({'id': '1'}, infer_missing=True)
+		self.assertIsNone(partial.to_dict()['upload_time'])
+		self.assertEqual(Artwork.from_dict(partial.to_dict()), partial)
+
+	def test_artwork_upload_time_is_parsed_on_construction(self):
+		artwork = Artwork(**self.artwork_data)
+		self.assertEqual(artwork.upload_time, datetime(2020, 1, 9, 7, 29, 43))
+		self.assertEqual(artwork, Artwork.from_dict(self.artwork_data))
+		self.assertEqual(artwork.to_dict(), self.artwork_data)
+
+	def test_create_product_add_variants_and_print_areas(self):
+		product = CreateProduct(
+			title='Product',
+			description='Description',
+			blueprint_id=384,
+			print_provider_id=1,
+			variants=[CreateProductVariant(id=45740, price=400, is_enabled=True)],
+			print_areas=[],
+		)
+		product.add_variants(
+			CreateProductVariant(id=variant_id, price=400, is_enabled=False)
+			for variant_id in (45742, 45744)
+		)
+		product.add_print_areas(
+			[
+				CreateProductPrintArea(variant_ids=[45740], placeholders=[]),
+				CreateProductPrintArea(variant_ids=[45742, 45744], placeholders=[]),
+			]
+		)
+
+		self.assertEqual([v.id for v in product.variants], [45740, 45742, 45744])
+		self.assertEqual([p.variant_ids for p in product.print_areas], [[45740], [45742, 45744]])
+
+	def test_repeated_strings_are_interned(self):
+		first = Artwork.from_dict({**self.artwork_data, 'mime_type': ''.join(['image/', 'png'])})
+		second = Artwork.from_dict({**self.artwork_data, 'mime_type': ''.join(['image/', 'png'])})
+		self.assertIs(first.mime_type, second.mime_type)
+
+		profiles = [
+			ShippingInfoProfile.from_dict(
+				{
+					'variant_ids': [45740],
+					'first_item': {'cost': 450, 'currency': ''.join(['U', 'SD'])},
+					'additional_items': {'cost': 450, 'currency': ''.join(['U', 'SD'])},
+					'countries': [''.join(['U', 'S'])],
+				}
+			)
+			for _ in range(2)
+		]
+		self.assertIs(profiles[0].countries[0], profiles[1].countries[0])
+		self.assertIs(profiles[0].first_item.currency, profiles[1].additional_items.currency)
+		countries = [''.join(['U', 'S'])]
+		profile = ShippingInfoProfile(
+			variant_ids=[45740],
+			first_item=profiles[0].first_item,
+			additional_items=profiles[0].additional_items,
+			countries=countries,
+		)
+		self.assertIs(profile.countries, countries)
+		self.assertIs(profile.countries[0], profiles[0].countries[0])
+
+		images = [
+			ProductImage.from_dict(
+				{
+					'src': 'https://example.com/image.png',
+					'variant_ids': [45740],
+					'position': ''.join(['fr', 'ont']),
+					'is_default': False,
+				}
+			)
+			for _ in range(2)
+		]
+		self.assertIs(images[0].position, images[1].position)
+
+	def test_create_requests_are_frozen_and_hashable(self):
+		variant = CreateProductVariant(id=45740, price=400, is_enabled=True)
+		webhook = CreateWebhook(url='https://example.com/webhooks', topic='order:created')
+		with self.assertRaises(FrozenInstanceError):
+			variant.price = 500
+		with self.assertRaises(FrozenInstanceError):
+			webhook.url = 'https://example.com/other'
+
+		self.assertEqual(
+			len({variant, CreateProductVariant(id=45740, price=400, is_enabled=True)}), 1
+		)
+		self.assertEqual(hash(webhook), hash(CreateWebhook.from_dict(webhook.to_dict())))
+
+	def test_response_value_objects_are_frozen_and_hashable(self):
+		costs = [
+			ShippingInfoProfileCost.from_dict({'cost': 450, 'currency': 'USD'}) for _ in range(3)
+		]
+		self.assertEqual(len(set(costs)), 1)
+		with self.assertRaises(FrozenInstanceError):
+			costs[0].cost = 500
+		self.assertEqual(
+			len(
+				{
+					VariantOption(color='Black', size='S'),
+					VariantOption.from_dict({'color': 'Black', 'size': 'S'}),
+				}
+			),
+			1,
+		)
+
+	def test_to_dict_converts_nested_objects(self):
+		product = CreateProduct(
+			title='Product',
+			description='Description',
+			blueprint_id=384,
+			print_provider_id=1,
+			variants=[CreateProductVariant(id=45740, price=400, is_enabled=True)],
+			print_areas=[
+				CreateProductPrintArea(
+					variant_ids=[45740],
+					placeholders=[
+						CreateProductPrintAreaPlaceholder(
+							position='front',
+							images=[
+								CreateProductPrintAreaPlaceholderImage(
+									id='image_id', x=0.5, y=0.5, scale=1, angle=0
+								)
+							],
+						)
+					],
+				)
+			],
+		)
+		expected = {
+			'title': 'Product',
+			'description': 'Description',
+			'blueprint_id': 384,
+			'print_provider_id': 1,
+			'variants': [{'id': 45740, 'price': 400, 'is_enabled': True}],
+			'print_areas': [
+				{
+					'variant_ids': [45740],
+					'placeholders': [
+						{
+							'position': 'front',
+							'images': [
+								{
+									'x': 0.5,
+									'y': 0.5,
+									'scale': 1,
+									'angle': 0,
+									'id': 'image_id',
+								}
+							],
+						}
+					],
+				}
+			],
+		}
+		self.assertEqual(product.to_dict(), expected)
+		self.assertEqual(list(product.to_dict()), list(expected))
+		self.assertEqual(CreateProduct.from_dict(expected), product)
+		self.assertIsNot(product.to_dict()['variants'], product.variants)
+
+	def test_generated_to_dict_drops_none_fields(self):
+		self.assertEqual(UpdateProduct().to_dict(), {})
+		update = UpdateProduct(
+			title='New title',
+			variants=[CreateProductVariant(id=45740, price=500, is_enabled=False)],
+			external=UpdateProductExternal(id='external', handle='https://example.com/product'),
+		)
+		self.assertEqual(
+			update.to_dict(),
+			{
+				'title': 'New title',
+				'variants': [{'id': 45740, 'price': 500, 'is_enabled': False}],
+				'external': {'id': 'external', 'handle': 'https://example.com/product'},
+			},
+		)
+		self.assertEqual(list(update.to_dict()), ['title', 'variants', 'external'])
+
+	@skipIf(not __debug__, 'assertions are stripped under python -O')
+	def test_create_product_inputs_are_checked_in_debug_mode(self):
+		with self.assertRaises(AssertionError):
+			CreateProductVariant(id=0, price=400, is_enabled=True)
+		with self.assertRaises(AssertionError):
+			CreateProductVariant(id=45740, price=-1, is_enabled=True)
+		with self.assertRaises(AssertionError):
+			CreateProductVariant(id=45740, price=12.95, is_enabled=True)
+		with self.assertRaises(AssertionError):
+			CreateProductPrintArea(variant_ids=[45740, '45742'], placeholders=[])
+		with self.assertRaises(AssertionError):
+			CreateProductVariant(id=True, price=400, is_enabled=True)
+		with self.assertRaises(AssertionError):
+			CreateProductPrintArea(variant_ids=[45740, True], placeholders=[])
+
+	def test_from_dict_decodes_unions_and_ignores_extra_keys(self):
+		data = {
+			'line_items': [
+				{'sku': 'MY-SKU', 'quantity': 1},
+				{'product_id': '5bfd0b66a342bcc9b5563216', 'variant_id': 17887, 'quantity': 2},
+				{'print_provider_id': 5, 'blueprint_id': 9, 'variant_id': 17887, 'quantity': 1},
+			],
+			'address_to': {
+				'first_name': 'John',
+				'last_name': 'Smith',
+				'address1': 'ExampleBaan 121',
+				'city': 'Retie',
+				'country': 'BE',
+				'region': '',
+				'zip': '2470',
+				'email': 'example@msn.com',
+				'phone': '0574 69 21 90',
+				'not_a_field': 'ignored',
+			},
+		}
+		estimate = CreateShippingEstimate.from_dict(data)
+		self.assertEqual(estimate.line_items[0].sku, 'MY-SKU')
+		self.assertIsInstance(estimate.line_items[0], ShippingEstimateLineItemBySku)
+		self.assertIsInstance(estimate.line_items[1], ShippingEstimateLineItemByProduct)
+		self.assertIsInstance(estimate.line_items[2], ShippingEstimateLineItemByVariant)
+		self.assertIsNone(estimate.address_to.company)
+		with self.assertRaises(KeyError):
+			CreateShippingEstimate.from_dict({'line_items': []})
+
+	def test_from_dict_infer_missing(self):
+		with self.assertRaises(KeyError):
+			CreateProductVariant.from_dict({'id': 45740})
+		webhook = CreateWebhook.from_dict({'url': 'https://example.com'}, infer_missing=True)
+		self.assertIsNone(webhook.topic)
+		variant = CreateProductVariant.from_dict({'id': 45740}, infer_missing=True)
+		self.assertIsNone(variant.price)
+		print_area = CreateProductPrintArea.from_dict({}, infer_missing=True)
+		self.assertIsNone(print_area.variant_ids)
+
+	def test_print_provider_variants_get_variant_ids(self):
+		print_provider_variants = PrintProviderVariants.from_dict(
+			{
+				'id': 3,
+				'title': 'DJ',
+				'variants': [
+					{'id': variant_id, 'title': 'S', 'options': {'size': 'S'}, 'placeholders': []}
+					for variant_id in (17390, 17426, 17438)
+				],
+			}
+		)
+		self.assertEqual(print_provider_variants.get_variant_ids(), [17390, 17426, 17438])
+
+	def test_from_list(self):
+		rows = [
+			{'id': 45740, 'price': 400, 'is_enabled': True},
+			{'id': 45742, 'price': 500, 'is_enabled': False},
+		]
+		self.assertEqual(
+			CreateProductVariant.from_list(rows),
+			[CreateProductVariant.from_dict(row) for row in rows],
+		)
+		self.assertEqual(CreateProductVariant.from_list([]), [])
+
+	def test_create_orders_serialize_line_items(self):
+		address = {
+			'first_name': 'John',
+			'last_name': 'Smith',
+			'address1': 'ExampleBaan 121',
+			'city': 'Retie',
+			'country': 'BE',
+			'region': '',
+			'zip': '2470',
+		}
+		order = {
+			'external_id': '2750e210-39bb-11e9-a503-452618153e5a',
+			'label': '00012',
+			'shipping_method': 1,
+			'send_shipping_notification': False,
+			'address_to': address,
+		}
+		sku_line_items = [{'sku': 'MY-SKU', 'quantity': 1}]
+		print_details_line_items = [
+			{
+				'variant_id': 17887,
+				'quantity': 1,
+				'print_provider_id': 5,
+				'blueprint_id': 9,
+				'print_areas': {'front': 'https://images.example.com/image.png'},
+				'print_details': {'print_on_side': 'mirror'},
+			}
+		]
+
+		by_sku = CreateOrderBySku.from_dict({**order, 'line_items': sku_line_items})
+		by_print_details = CreateOrderByPrintDetails.from_dict(
+			{**order, 'line_items': print_details_line_items}
+		)
+		self.assertEqual(by_sku.to_dict()['line_items'], sku_line_items)
+		self.assertEqual(by_print_details.to_dict()['line_items'], print_details_line_items)
+
+	def test_to_dict_encodes_plain_dataclasses_in_free_form_fields(self):
+		@dataclass
+		class Image:
+			src: str
+			scale: float
+
+		line_item = CreateOrderLineItemPrintDetails.from_dict(
+			{
+				'variant_id': 17887,
+				'quantity': 1,
+				'print_provider_id': 5,
+				'blueprint_id': 9,
+				'print_areas': {
+					'front': Image(src='https://images.example.com/image.png', scale=1.0)
+				},
+				'print_details': {'print_on_side': 'mirror'},
+			}
+		)
+		self.assertEqual(
+			line_item.to_dict()['print_areas'],
+			{'front': {'src': 'https://images.example.com/image.png', 'scale': 1.0}},
+		)
+
+	def test_request_bodies_accept_non_str_keys_in_free_form_fields(self):
+		line_item = CreateOrderLineItemPrintDetails(
+			variant_id=17887,
+			quantity=1,
+			print_provider_id=5,
+			blueprint_id=9,
+			print_areas={1: 'https://images.example.com/image.png'},
+			print_details={'print_on_side': 'mirror'},
+		)
+		# Same output with or without the optional orjson extra installed
+		self.assertEqual(
+			loads(dumps(line_item.to_dict()))['print_areas'],
+			{'1': 'https://images.example.com/image.png'},
+		)
+
+	def test_codec_methods_are_generated_on_first_use(self):
+		artwork = Artwork.from_dict(self.artwork_data)
+		self.assertEqual(artwork.to_dict(), self.artwork_data)
+		# The generated methods replace the lazy placeholders on the class itself
+		self.assertIsInstance(vars(Artwork)['from_dict'], classmethod)
+		self.assertTrue(callable(vars(Artwork)['to_dict']))
+
+	def test_subclasses_encode_and_decode_their_own_fields(self):
+		@dataclass
+		class MyShop(Shop):
+			extra: str = 'x'
+
+		data = {'id': '5432', 'title': 'My new store', 'sales_channel': 'etsy'}
+		# Generate the base class codec first; subclasses must not reuse it
+		self.assertEqual(Shop.from_dict(data).to_dict(), data)
+
+		shop = MyShop.from_dict({**data, 'extra': 'y'})
+		self.assertIsInstance(shop, MyShop)
+		self.assertEqual(shop.extra, 'y')
+		self.assertEqual(shop.to_dict(), {**data, 'extra': 'y'})
+		self.assertEqual(MyShop(**data).to_dict(), {**data, 'extra': 'x'})
+		self.assertEqual(Shop.from_dict(data).to_dict(), data)
+
+	def test_publish_default_is_shared(self):
+		self.assertIs(Publish.default(), Publish.default())
+		self.assertEqual(Publish.default(), Publish())
+		with self.assertRaises(FrozenInstanceError):
+			Publish.default().title = False
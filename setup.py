@@ -26,5 +26,6 @@ setuptools.setup(
 	python_requires='>=3.8',
 	py_modules=['printipy'],
 	packages=setuptools.find_packages(exclude=['*tests*']),
-	install_requires=['requests', 'dataclasses-json'],
+	install_requires=['requests'],
+	extras_require={'orjson': ['orjson']},
 )